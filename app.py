@@ -3,7 +3,8 @@
 import os
 import traceback
 import tkinter as tk
-import openpyxl
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Optional
 from tkinter import filedialog, messagebox
 from pathlib import Path
 from logger_to_report import parse_logger_csv, downsample_full_minutes, build_report
@@ -36,18 +37,16 @@ def generate_report(
     # Downsample to whole minutes
     parsed = downsample_full_minutes(parsed, tol_seconds=minute_tolerance_seconds)
 
-    # Build the report workbook (this writes the file)
-    build_report(parsed, Path(output_xlsx_path), source_filename=os.path.basename(input_csv_path))
-
-    # Apply UI settings into the Config sheet after creation
-    wb = openpyxl.load_workbook(output_xlsx_path)
-    if "Config" in wb.sheetnames:
-        ws = wb["Config"]
-        ws["B3"] = face_start
-        ws["B4"] = face_count
-        ws["B6"] = core_start
-        ws["B7"] = core_count
-    wb.save(output_xlsx_path)
+    # Build the report workbook (this writes the file, Config sheet included)
+    build_report(
+        parsed,
+        Path(output_xlsx_path),
+        source_filename=os.path.basename(input_csv_path),
+        face_start=face_start,
+        face_count=face_count,
+        core_start=core_start,
+        core_count=core_count,
+    )
 
 
 class App(tk.Tk):
@@ -68,6 +67,10 @@ class App(tk.Tk):
         self.furnace_max_var = tk.StringVar(value="399")
         self.minute_tol_var = tk.StringVar(value="0.5")
 
+        # Report generation runs here so the window keeps responding
+        self._executor = ThreadPoolExecutor(max_workers=1)
+        self._pending: Optional[Future] = None
+
         self._build_ui()
 
     def _build_ui(self) -> None:
@@ -131,7 +134,9 @@ class App(tk.Tk):
 
         self.input_path_var.set(path)
         self.output_path_var.set(build_output_path(path))
-        self.run_btn.config(state="normal")
+        # While a report is being generated the button stays disabled; _poll_future re-enables it.
+        if self._pending is None:
+            self.run_btn.config(state="normal")
 
     def _get_int(self, label: str, value: str) -> int:
         try:
@@ -146,6 +151,9 @@ class App(tk.Tk):
             raise ValueError(f"{label} must be a number.")
 
     def on_run(self) -> None:
+        if self._pending is not None:
+            return
+
         input_path = self.input_path_var.get().strip()
         output_path = self.output_path_var.get().strip()
 
@@ -161,29 +169,40 @@ class App(tk.Tk):
             furnace_min = self._get_int("Furnace min channel", self.furnace_min_var.get().strip())
             furnace_max = self._get_int("Furnace max channel", self.furnace_max_var.get().strip())
             minute_tol = self._get_float("Minute tolerance (sec)", self.minute_tol_var.get().strip())
+        except ValueError as ex:
+            messagebox.showerror("Error", str(ex))
+            return
 
-            self.run_btn.config(state="disabled")
-            self.update_idletasks()
-
-            generate_report(
-                input_csv_path=input_path,
-                output_xlsx_path=output_path,
-                face_start=face_start,
-                face_count=face_count,
-                core_start=core_start,
-                core_count=core_count,
-                furnace_min=furnace_min,
-                furnace_max=furnace_max,
-                minute_tolerance_seconds=minute_tol,
-            )
+        self.run_btn.config(state="disabled")
+
+        future = self._pending = self._executor.submit(
+            generate_report,
+            input_csv_path=input_path,
+            output_xlsx_path=output_path,
+            face_start=face_start,
+            face_count=face_count,
+            core_start=core_start,
+            core_count=core_count,
+            furnace_min=furnace_min,
+            furnace_max=furnace_max,
+            minute_tolerance_seconds=minute_tol,
+        )
+        self.after(100, self._poll_future, future, output_path)
 
-            messagebox.showinfo("Done", f"Report created:\n{output_path}")
+    def _poll_future(self, future: Future, output_path: str) -> None:
+        if not future.done():
+            self.after(100, self._poll_future, future, output_path)
+            return
 
-        except Exception as ex:
-            details = traceback.format_exc()
+        self._pending = None
+        self.run_btn.config(state="normal")
+
+        ex = future.exception()
+        if ex is None:
+            messagebox.showinfo("Done", f"Report created:\n{output_path}")
+        else:
+            details = "".join(traceback.format_exception(type(ex), ex, ex.__traceback__))
             messagebox.showerror("Error", f"{ex}\n\nDetails:\n{details}")
-        finally:
-            self.run_btn.config(state="normal")
 
 
 if __name__ == "__main__":
@@ -24,49 +24,49 @@ from __future__ import annotations
 
 import argparse
 import datetime as dt
+import functools
+import hashlib
+import json
+import os
 import re
+import tempfile
+import time
+import zipfile
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Dict, List, Tuple
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, TextIO, Tuple
 
-import openpyxl
-from openpyxl import Workbook
-from openpyxl.chart import LineChart, Reference
-from openpyxl.styles import Alignment, Font, PatternFill
-from openpyxl.utils import get_column_letter
+import numpy as np
+import pandas as pd
+import xlsxwriter
+from xlsxwriter.utility import xl_col_to_name
+
+# Hard limits per requirement on the TCs carried into the report
+_MAX_SPECIMEN_TCS = 35
+_MAX_FURNACE_TCS = 5
+
+# Raw Data column letters by zero-based index: Scan/Date/Time/Elapsed, absolute and rise
+# columns for every specimen and furnace TC, then the five summary columns.
+_COL_LETTERS = tuple(xl_col_to_name(c) for c in range(4 + 2 * (_MAX_SPECIMEN_TCS + _MAX_FURNACE_TCS) + 5))
 
 
 @dataclass
 class ParsedLoggerFile:
     metadata: Dict[str, str]
     channels: List[int]
-    rows: List[Tuple[int, dt.date, dt.time, float, Dict[int, float]]]
-    # rows: (scan, date, time, elapsed_minutes, {channel: value})
+    # One entry per logged row, stored column-wise:
+    scans: np.ndarray  # int32
+    timestamps: np.ndarray  # datetime64[ms]
+    elapsed_min: np.ndarray  # float64, minutes since the first (ambient) row
+    values: np.ndarray  # float64, shape (rows, channels); NaN = no reading
 
+    @property
+    def channel_to_col(self) -> Dict[int, int]:
+        """Map channel number to its column in `values`."""
+        return {ch: i for i, ch in enumerate(self.channels)}
 
-def _read_lines_utf16(path: Path) -> List[str]:
-    """Read the logger export file.
 
-    The INSTR export is typically UTF-16. Some files are tab-delimited, others are comma-delimited.
-    We keep raw lines and detect delimiter later.
-    """
-    with path.open("r", encoding="utf-16") as f:
-        return f.read().splitlines()
-
-
-def _detect_delimiter_from_channel_header(lines: List[str]) -> str:
-    """Return '\t' or ',' depending on the channel table header format."""
-    for line in lines[:200]:
-        s = line.strip()
-        if s.startswith("Channel") and "Name" in s and "Function" in s:
-            if "\t" in s and "Channel\tName\tFunction" in s:
-                return "\t"
-            if "," in s and "Channel,Name,Function" in s:
-                return ","
-    # Fallback: choose the most common delimiter among early lines
-    tab_hits = sum(1 for l in lines[:50] if "\t" in l)
-    comma_hits = sum(1 for l in lines[:50] if "," in l)
-    return "\t" if tab_hits >= comma_hits else ","
+_METADATA_KEYS = {"Name", "Owner", "Comments", "Total", "Acquisition", "Acquisition Date"}
 
 
 def _split_fields(line: str, delim: str) -> List[str]:
@@ -76,89 +76,78 @@ def _split_fields(line: str, delim: str) -> List[str]:
     return [p.strip() for p in line.split("\t")]
 
 
-def _parse_metadata(lines: List[str]) -> Dict[str, str]:
+def _scan_header(f: TextIO) -> Tuple[Dict[str, str], str, List[int]]:
+    """Read the header region of a logger export in one pass.
+
+    Returns (metadata, delimiter, channels). The delimiter ('\t' or ',') is taken from the
+    channel table header (Channel Name Function ...), the channel numbers from the rows between
+    it and the 'Scan Control:' marker. Reading stops at the data table header (Scan Time ...),
+    leaving the file positioned at the first data row so the table can be streamed from there.
+    """
     meta: Dict[str, str] = {}
-    for line in lines[:60]:
-        # Metadata rows differ between exports (tab or comma). Split heuristically.
-        if "\t" in line:
-            parts = [p.strip() for p in line.split("\t")]
-        else:
-            parts = [p.strip() for p in line.split(",")]
-        if not parts:
-            continue
-        key = parts[0].strip().strip(":")
-        if key in {"Name", "Owner", "Comments", "Total", "Acquisition", "Acquisition Date"}:
-            value = " ".join(p for p in parts[1:] if p)
-            meta[key] = value
-    return meta
-
-
-def _find_channel_def_block(lines: List[str], delim: str) -> Tuple[int, int]:
-    """Return (start_idx, end_idx_exclusive) for channel definition rows."""
-    start = None
-    header_tab = "Channel\tName\tFunction"
-    header_comma = "Channel,Name,Function"
-    for i, line in enumerate(lines):
+    delim: Optional[str] = None
+    channels: List[int] = []
+    in_channels = False
+
+    for i, line in enumerate(iter(f.readline, "")):
+        line = line.rstrip("\r\n")
         s = line.strip()
-        if (delim == "\t" and s.startswith(header_tab)) or (delim == "," and s.startswith(header_comma)):
-            start = i + 1
-            break
-    if start is None:
-        raise ValueError("Could not find channel definition table header (Channel Name Function...).")
 
-    end = None
-    for i in range(start, len(lines)):
-        s = lines[i].lstrip()
-        # Both formats have a 'Scan Control:' marker line between channel table and data header.
-        if s.startswith("Scan") and "Control:" in s:
-            end = i
-            break
-    if end is None:
+        if i < 60:
+            # Metadata rows differ between exports (tab or comma). Split heuristically.
+            parts = _split_fields(line, "\t" if "\t" in line else ",")
+            key = parts[0].strip(":")
+            if key in _METADATA_KEYS:
+                meta[key] = " ".join(p for p in parts[1:] if p)
+
+        if delim is None:
+            if s.startswith("Channel\tName\tFunction"):
+                delim, in_channels = "\t", True
+            elif s.startswith("Channel,Name,Function"):
+                delim, in_channels = ",", True
+        elif in_channels:
+            # Both formats have a 'Scan Control:' marker line between channel table and data header.
+            if line.lstrip().startswith("Scan") and "Control:" in line:
+                if not channels:
+                    raise ValueError("No channels found in channel definition block.")
+                in_channels = False
+                continue
+            try:
+                channels.append(int(_split_fields(line, delim)[0]))
+            except ValueError:
+                pass
+        elif s.startswith("Scan\tTime\t" if delim == "\t" else "Scan,Time"):
+            return meta, delim, channels
+
+    if delim is None:
+        raise ValueError("Could not find channel definition table header (Channel Name Function...).")
+    if in_channels:
         raise ValueError("Could not find end of channel definition block (Scan Control:...).")
-    return start, end
+    raise ValueError("Could not find data table header (Scan Time ...).")
 
 
-def _parse_channels(lines: List[str], start: int, end: int, delim: str) -> List[int]:
-    channels: List[int] = []
-    for line in lines[start:end]:
-        parts = _split_fields(line, delim)
-        if not parts:
-            continue
-        try:
-            ch = int(str(parts[0]).strip())
-        except Exception:
-            continue
-        channels.append(ch)
-    if not channels:
-        raise ValueError("No channels found in channel definition block.")
-    return channels
-
-
-def _find_data_header(lines: List[str], delim: str) -> int:
-    # The data header typically starts with Scan + Time
-    for i, line in enumerate(lines):
-        s = line.strip()
-        if delim == "\t":
-            if s.startswith("Scan\tTime\t"):
-                return i
-        else:
-            if s.startswith("Scan,Time,") or s.startswith("Scan,Time"):
-                return i
-    raise ValueError("Could not find data table header (Scan Time ...).")
+# time: hh:mm:ss:ms
+# Some files may have hh:mm:ss or hh:mm:ss:fff
+_TIME_RE = re.compile(r"^(\d{1,2}):(\d{2}):(\d{2})(?::(\d{1,3}))?$")
 
 
-def _parse_timestamp(date_s: str, time_s: str) -> dt.datetime:
+@functools.lru_cache(maxsize=4)
+def _parse_date(date_s: str) -> dt.datetime:
     # date: dd/mm/yyyy
-    d = dt.datetime.strptime(date_s.strip(), "%d/%m/%Y").date()
-    # time: hh:mm:ss:ms
-    # Some files may have hh:mm:ss or hh:mm:ss:fff
-    m = re.match(r"^(\d{1,2}):(\d{2}):(\d{2})(?::(\d{1,3}))?$", time_s.strip())
+    # A log rarely spans more than a couple of dates, so strptime runs only a few times per file.
+    return dt.datetime.strptime(date_s, "%d/%m/%Y")
+
+
+def _parse_timestamp(date_s: str, time_s: str) -> dt.datetime:
+    m = _TIME_RE.match(time_s.strip())
     if not m:
         raise ValueError(f"Unrecognised time format: {time_s!r}")
     hh, mm, ss, ms = m.groups()
-    micro = int(ms) * 1000 if ms else 0
-    t = dt.time(int(hh), int(mm), int(ss), micro)
-    return dt.datetime.combine(d, t)
+    h, mi, sec = int(hh), int(mm), int(ss)
+    if h > 23 or mi > 59 or sec > 59:
+        raise ValueError(f"Unrecognised time format: {time_s!r}")
+    millis = ((h * 60 + mi) * 60 + sec) * 1000 + (int(ms) if ms else 0)
+    return _parse_date(date_s.strip()) + dt.timedelta(milliseconds=millis)
 
 
 def _parse_timestamp_one_field(dt_s: str) -> dt.datetime:
@@ -172,107 +161,268 @@ def _parse_timestamp_one_field(dt_s: str) -> dt.datetime:
     return _parse_timestamp(date_s, time_s)
 
 
-def parse_logger_csv(path: Path) -> ParsedLoggerFile:
-    lines = _read_lines_utf16(path)
-    delim = _detect_delimiter_from_channel_header(lines)
-
-    meta = _parse_metadata(lines)
-
-    ch_start, ch_end = _find_channel_def_block(lines, delim)
-    channels = _parse_channels(lines, ch_start, ch_end, delim)
-
-    data_header_idx = _find_data_header(lines, delim)
-    first_data_idx = data_header_idx + 1
-
-    rows: List[Tuple[int, dt.date, dt.time, float, Dict[int, float]]] = []
-    first_ts: dt.datetime | None = None
-
-    for line in lines[first_data_idx:]:
-        if not line.strip():
-            continue
-
-        parts = _split_fields(line, delim)
-        if len(parts) < 3:
-            continue
-
-        # Stop if we hit another section header
-        if parts[0].lower().startswith("scan") and "time" in (parts[1].lower() if len(parts) > 1 else ""):
-            continue
+def _read_data_table(
+    f: TextIO, n_fields: int, delim: str, ts_cols: List[int], value_cols: List[int]
+) -> pd.DataFrame:
+    """Read the data table from the current position of `f` with pandas' C parser.
 
+    Only the scan, timestamp and channel value columns are loaded (alarm columns are skipped).
+    Value columns are parsed straight to float; if a file has non-numeric text in a value
+    column, fall back to reading it as text and treating unparseable cells as missing.
+    """
+    usecols = [0] + ts_cols + value_cols
+    text_cols = {c: str for c in [0] + ts_cols}
+    kwargs = dict(
+        # The handle decodes UTF-16 in C and pandas re-encodes each chunk for its tokenizer.
+        # Pin the C engine so an unsupported option can never fall back to the Python parser.
+        engine="c",
+        sep=delim,
+        header=None,
+        # Name at least every column up to the last value column so short rows are padded with NaN
+        names=range(max(n_fields, max(usecols) + 1)),
+        usecols=usecols,
+    )
+    start = f.tell()
+    try:
+        return pd.read_csv(f, dtype={**text_cols, **{c: np.float64 for c in value_cols}}, **kwargs)
+    except pd.errors.EmptyDataError:
+        raise ValueError("No data rows parsed from file.") from None
+    except ValueError:
+        f.seek(start)
+        df = pd.read_csv(f, dtype=str, **kwargs)
+        df[value_cols] = df[value_cols].apply(pd.to_numeric, errors="coerce")
+        return df
+
+
+# Bump whenever parsing changes what ends up in ParsedLoggerFile, so stale cache entries are ignored.
+_CACHE_VERSION = 1
+# Entries are uncompressed (tens of MB for a long log); drop any not used for a week.
+_CACHE_MAX_AGE_S = 7 * 24 * 3600
+
+
+def _cache_path(path: Path) -> Path:
+    """Cache file for `path`, keyed on its location, modification time and size."""
+    st = path.stat()
+    key = f"{path.resolve()}:{st.st_mtime_ns}:{st.st_size}:v{_CACHE_VERSION}"
+    digest = hashlib.blake2b(key.encode("utf-8"), digest_size=8).hexdigest()
+    return Path(tempfile.gettempdir()) / f"instr_{digest}.npz"
+
+
+def _load_cached(cache_path: Path) -> Optional[ParsedLoggerFile]:
+    try:
+        with np.load(cache_path, allow_pickle=False) as z:
+            parsed = ParsedLoggerFile(
+                metadata=json.loads(str(z["metadata"])),
+                channels=z["channels"].tolist(),
+                scans=z["scans"],
+                timestamps=z["timestamps"],
+                elapsed_min=z["elapsed_min"],
+                values=z["values"],
+            )
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError, KeyError, EOFError, zipfile.BadZipFile):
+        # Unreadable (e.g. truncated) cache entry: remove it and parse the file instead.
         try:
-            scan = int(parts[0])
-        except Exception:
-            continue
+            cache_path.unlink(missing_ok=True)
+        except OSError:
+            pass
+        return None
+    try:
+        # Mark the entry as recently used so _prune_cache keeps it.
+        os.utime(cache_path)
+    except OSError:
+        pass
+    return parsed
+
+
+def _prune_cache(cache_dir: Path) -> None:
+    """Delete cache entries that have not been used for _CACHE_MAX_AGE_S."""
+    cutoff = time.time() - _CACHE_MAX_AGE_S
+    for entry in cache_dir.glob("instr_*.npz"):
+        try:
+            if entry.stat().st_mtime < cutoff:
+                entry.unlink()
+        except OSError:
+            pass
+
+
+def _save_cached(cache_path: Path, parsed: ParsedLoggerFile) -> None:
+    # Uncompressed: the cache only pays off if it is much cheaper to write and read than a re-parse.
+    tmp_path = cache_path.with_name(f"{cache_path.stem}.{os.getpid()}.tmp")
+    try:
+        with tmp_path.open("wb") as f:
+            np.savez(
+                f,
+                metadata=np.array(json.dumps(parsed.metadata)),
+                channels=np.array(parsed.channels, dtype=np.int64),
+                scans=parsed.scans,
+                timestamps=parsed.timestamps,
+                elapsed_min=parsed.elapsed_min,
+                values=parsed.values,
+            )
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        # Caching is best-effort; a read-only temp dir must not stop the report.
+        tmp_path.unlink(missing_ok=True)
+        return
+    _prune_cache(cache_path.parent)
+
+
+def parse_logger_csv(path: Path, use_cache: bool = True) -> ParsedLoggerFile:
+    """Parse a logger export, reusing a previous parse of the same unchanged file if cached."""
+    if not use_cache:
+        return _parse_logger_file(path)
+
+    cache_path = _cache_path(path)
+    parsed = _load_cached(cache_path)
+    if parsed is None:
+        parsed = _parse_logger_file(path)
+        _save_cached(cache_path, parsed)
+    return parsed
+
+
+def _parse_logger_file(path: Path) -> ParsedLoggerFile:
+    # The INSTR export is typically UTF-16.
+    with path.open("r", encoding="utf-16", newline="") as f:
+        meta, delim, channels = _scan_header(f)
 
         # Two known layouts:
         #  A) Tab export: Scan, Date, Time, (value, alarm)*N
         #  B) Comma export: Scan, DateTime, (value, alarm)*N
-        if delim == "\t":
-            if len(parts) < 4:
-                continue
-            date_s = parts[1]
-            time_s = parts[2]
-            ts = _parse_timestamp(date_s, time_s)
-            data_start_idx = 3
-        else:
-            ts = _parse_timestamp_one_field(parts[1])
-            data_start_idx = 2
+        ts_cols = [1, 2] if delim == "\t" else [1]
+        data_start_idx = 1 + len(ts_cols)
+        # Each channel contributes two columns: value, alarm.
+        value_cols = [data_start_idx + ci * 2 for ci in range(len(channels))]
+
+        # Peek at the first data row for the column count, then rewind for pandas.
+        data_pos = f.tell()
+        first_data_line = next((line for line in iter(f.readline, "") if line.strip()), None)
+        if first_data_line is None:
+            raise ValueError("No data rows parsed from file.")
+        n_fields = len(first_data_line.rstrip("\r\n").split(delim))
+        f.seek(data_pos)
+        df = _read_data_table(f, n_fields, delim, ts_cols, value_cols)
+
+    # Drop anything that is not a data row (repeated section headers, short rows, ...)
+    scans = pd.to_numeric(df[0].str.strip(), errors="coerce")
+    keep = scans.notna() & (scans == scans.round()) & df[ts_cols].notna().all(axis=1)
+    df = df[keep]
+    scans = scans[keep]
+
+    # The layout is fixed for the whole file: pick the timestamp parser once and feed it plain lists.
+    parse_ts = _parse_timestamp if delim == "\t" else _parse_timestamp_one_field
+    stamps = [parse_ts(*fields) for fields in zip(*(df[c].tolist() for c in ts_cols))]
+
+    if not stamps:
+        raise ValueError("No data rows parsed from file.")
 
-        if first_ts is None:
-            first_ts = ts
-        elapsed_min = (ts - first_ts).total_seconds() / 60.0
+    timestamps = np.array(stamps, dtype="datetime64[ms]")
+    elapsed_min = (timestamps - timestamps[0]) / np.timedelta64(1, "m")
 
-        values: Dict[int, float] = {}
+    return ParsedLoggerFile(
+        metadata=meta,
+        channels=channels,
+        scans=scans.to_numpy(dtype=np.int32),
+        timestamps=timestamps,
+        elapsed_min=elapsed_min,
+        values=df[value_cols].to_numpy(dtype=np.float64),
+    )
 
-        # Each channel contributes two columns: value, alarm.
-        # Some files include trailing empty columns; ignore.
-        for ci, ch in enumerate(channels):
-            v_idx = data_start_idx + ci * 2
-            if v_idx >= len(parts):
-                break
-            v = parts[v_idx]
-            if v == "":
-                continue
-            try:
-                values[ch] = float(v)
-            except Exception:
-                continue
+def downsample_full_minutes(parsed: ParsedLoggerFile, tol_seconds: float = 0.6) -> ParsedLoggerFile:
+    # Keep row 0 (ambient) and any row where elapsed time is within tol of a whole minute.
+    elapsed_sec = parsed.elapsed_min * 60.0
+    minutes = np.round(elapsed_sec / 60.0)
+    # distance to nearest whole minute
+    keep = np.abs(elapsed_sec - minutes * 60.0) <= tol_seconds
+    keep[0] = True
+    return ParsedLoggerFile(
+        metadata=parsed.metadata,
+        channels=parsed.channels,
+        scans=parsed.scans[keep],
+        timestamps=parsed.timestamps[keep],
+        elapsed_min=minutes[keep],
+        values=parsed.values[keep],
+    )
+
+
+def _row_mean(a: np.ndarray) -> np.ndarray:
+    """Row-wise mean that skips blanks (NaN) like Excel's AVERAGE; NaN if a row is all blank."""
+    counts = np.count_nonzero(~np.isnan(a), axis=1)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        return np.nansum(a, axis=1) / counts
+
+
+def _row_max(a: np.ndarray) -> np.ndarray:
+    """Row-wise max that skips blanks (NaN); NaN if a row is all blank."""
+    if a.shape[1] == 0:
+        return np.full(a.shape[0], np.nan)
+    return np.fmax.reduce(a, axis=1)
+
+
+def _rows_xml(
+    grid: np.ndarray, first_row: int, letters: Sequence[str], styles: List[str]
+) -> Iterator[str]:
+    """Yield one <row> element per row of `grid`, numbered from `first_row` (1-based).
+
+    Blank (NaN) cells are left out; `styles` holds the ` s="<xf index>"` attribute per column.
+    """
+    for r, vals in enumerate(grid.tolist(), start=first_row):
+        cells = "".join([
+            f'<c r="{col}{r}"{s}><v>{v:.16G}</v></c>'
+            for col, s, v in zip(letters, styles, vals)
+            if v == v  # skip blanks (NaN)
+        ])
+        yield f'<row r="{r}">{cells}</row>'
 
-        rows.append((scan, ts.date(), ts.time(), elapsed_min, values))
 
-    if not rows:
-        raise ValueError("No data rows parsed from file.")
+# The report is opened locally straight after it's written; DEFLATE level 1 is several times faster
+# than the default 6 on the Raw Data XML for a file only modestly larger.
+_ZIP_COMPRESSLEVEL = 1
 
-    return ParsedLoggerFile(metadata=meta, channels=channels, rows=rows)
 
-def downsample_full_minutes(parsed: ParsedLoggerFile, tol_seconds: float = 0.6) -> ParsedLoggerFile:
-    # Keep row 0 (ambient) and any row where elapsed time is within tol of a whole minute.
-    kept: List[Tuple[int, dt.date, dt.time, float, Dict[int, float]]] = []
-    for idx, r in enumerate(parsed.rows):
-        scan, d, t, elapsed_min, values = r
-        if idx == 0:
-            kept.append(r)
-            continue
-        elapsed_sec = elapsed_min * 60.0
-        # distance to nearest whole minute
-        dist = abs(elapsed_sec - round(elapsed_sec / 60.0) * 60.0)
-        if dist <= tol_seconds:
-            kept.append((scan, d, t, round(elapsed_sec / 60.0), values))
-    return ParsedLoggerFile(metadata=parsed.metadata, channels=parsed.channels, rows=kept)
-
-
-def _style_header(ws, cell_range: str) -> None:
-    fill = PatternFill("solid", fgColor="1F4E79")
-    font = Font(color="FFFFFF", bold=True)
-    align = Alignment(horizontal="center", vertical="center", wrap_text=True)
-    for row in ws[cell_range]:
-        for cell in row:
-            cell.fill = fill
-            cell.font = font
-            cell.alignment = align
-
-
-def build_report(parsed: ParsedLoggerFile, out_path: Path, source_filename: str) -> None:
+def _append_sheet_rows(xlsx_path: Path, part: str, rows: Iterable[str], dimension: str) -> None:
+    """Append pre-rendered <row> elements to the end of a worksheet's sheetData in a saved .xlsx.
+
+    The package is copied to a temporary file with `part` rewritten, then moved over the original.
+    """
+    tmp_path = xlsx_path.with_name(xlsx_path.name + ".tmp")
+    try:
+        with zipfile.ZipFile(xlsx_path) as zin, zipfile.ZipFile(
+            tmp_path, "w", zipfile.ZIP_DEFLATED, compresslevel=_ZIP_COMPRESSLEVEL
+        ) as zout:
+            for item in zin.infolist():
+                if item.filename != part:
+                    zout.writestr(item.filename, zin.read(item.filename))
+                    continue
+                xml = zin.read(part).decode("utf-8")
+                if "</sheetData>" not in xml:
+                    raise ValueError(f"No </sheetData> in {part}; cannot append rows.")
+                head, tail = xml.split("</sheetData>", 1)
+                head = re.sub(
+                    r'<dimension ref="[^"]*"/>', f'<dimension ref="{dimension}"/>', head, count=1
+                )
+                with zout.open(part, "w", force_zip64=True) as f:
+                    f.write(head.encode("utf-8"))
+                    for row in rows:
+                        f.write(row.encode("utf-8"))
+                    f.write(("</sheetData>" + tail).encode("utf-8"))
+        os.replace(tmp_path, xlsx_path)
+    except BaseException:
+        # Don't leave a half-written copy next to the report.
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+
+def build_report(
+    parsed: ParsedLoggerFile,
+    out_path: Path,
+    source_filename: str,
+    face_start: int = 1,
+    face_count: Optional[int] = None,
+    core_start: int = 6,
+    core_count: Optional[int] = None,
+) -> None:
     # Categorize channels
     furnace = [ch for ch in parsed.channels if 300 <= ch < 400]
     specimen = [ch for ch in parsed.channels if ch not in furnace]
@@ -280,40 +430,92 @@ def build_report(parsed: ParsedLoggerFile, out_path: Path, source_filename: str)
     specimen.sort()
 
     # Hard limits per requirement
-    specimen = specimen[:35]
-    furnace = furnace[:5]
+    specimen = specimen[:_MAX_SPECIMEN_TCS]
+    furnace = furnace[:_MAX_FURNACE_TCS]
 
-    wb: Workbook = openpyxl.Workbook()
+    # Defaults matching the user's example (1-5 face, 6-10 core)
+    if face_count is None:
+        face_count = min(5, len(specimen))
+    if core_count is None:
+        core_count = min(5, max(0, len(specimen) - 5))
+    for label, start, count in [("Face", face_start, face_count), ("Core", core_start, core_count)]:
+        if start < 1:
+            raise ValueError(f"{label} TC start must be 1 or more.")
+        if count < 0:
+            raise ValueError(f"{label} TC count must not be negative.")
+
+    # constant_memory: each row is flushed to disk once a later row is written, so rows
+    # must be written top to bottom on every sheet. Rows/columns below are zero-based.
+    wb = xlsxwriter.Workbook(str(out_path), {"constant_memory": True})
     # Ensure predictable sheet order
-    ws_summary = wb.active
-    ws_summary.title = "Summary of Results"
-    ws_obs = wb.create_sheet("Observations")
-    ws_raw = wb.create_sheet("Raw Data")
-    ws_cfg = wb.create_sheet("Config")
+    ws_summary = wb.add_worksheet("Summary of Results")
+    ws_obs = wb.add_worksheet("Observations")
+    ws_raw = wb.add_worksheet("Raw Data")
+    ws_cfg = wb.add_worksheet("Config")
+
+    # Slightly nicer default view
+    for ws in [ws_summary, ws_obs, ws_raw, ws_cfg]:
+        ws.hide_gridlines(2)
+
+    bold = wb.add_format({"bold": True})
+    title = wb.add_format({"bold": True, "font_size": 14})
+    summary_title = wb.add_format({"bold": True, "font_size": 16})
+    center = wb.add_format({"align": "center", "valign": "vcenter"})
+    header = wb.add_format({
+        "bold": True,
+        "font_color": "#FFFFFF",
+        "bg_color": "#1F4E79",
+        "pattern": 1,
+        "align": "center",
+        "valign": "vcenter",
+        "text_wrap": True,
+    })
+    date_fmt = wb.add_format({"num_format": "dd/mm/yyyy"})
+    time_fmt = wb.add_format({"num_format": "hh:mm:ss"})
+    minutes_fmt = wb.add_format({"num_format": "0"})
+    one_dp = wb.add_format({"num_format": "0.0"})
 
     # ----------------
     # Config sheet
     # ----------------
-    ws_cfg["A1"] = "Group configuration (edit these if your TC layout differs)"
-    ws_cfg["A1"].font = Font(bold=True)
-    ws_cfg["A3"] = "Face start TC #"
-    ws_cfg["A4"] = "Face count"
-    ws_cfg["A6"] = "Core start TC #"
-    ws_cfg["A7"] = "Core count"
-    # Defaults matching the user's example (1-5 face, 6-10 core)
-    ws_cfg["B3"] = 1
-    ws_cfg["B4"] = min(5, len(specimen))
-    ws_cfg["B6"] = 6
-    ws_cfg["B7"] = min(5, max(0, len(specimen) - 5))
-    ws_cfg.column_dimensions["A"].width = 28
-    ws_cfg.column_dimensions["B"].width = 16
+    ws_cfg.set_column(0, 0, 28)
+    ws_cfg.set_column(1, 1, 16)
+    ws_cfg.write(0, 0, "Group configuration used for the summary columns", bold)
+    ws_cfg.write_row(2, 0, ["Face start TC #", face_start])
+    ws_cfg.write_row(3, 0, ["Face count", face_count])
+    ws_cfg.write_row(5, 0, ["Core start TC #", core_start])
+    ws_cfg.write_row(6, 0, ["Core count", core_count])
 
     # ----------------
     # Raw Data sheet
     # ----------------
-    ws_raw["A1"] = "Imported logger data (absolute and temperature rise)"
-    ws_raw["A1"].font = Font(bold=True, size=14)
-    # Metadata block
+    header_row_1 = 11  # group names
+    header_row_2 = 12  # column headers
+    data_start_row = 13
+
+    # Column layout: base columns, specimen absolute, specimen rise,
+    # furnace absolute, furnace rise, summary
+    spec_abs_start_col = 4
+    spec_rise_start_col = spec_abs_start_col + len(specimen)
+    furnace_abs_start_col = spec_rise_start_col + len(specimen)
+    furnace_rise_start_col = furnace_abs_start_col + len(furnace)
+    summary_start_col = furnace_rise_start_col + len(furnace)
+
+    # Column widths
+    ws_raw.set_column(0, 0, 18)
+    ws_raw.set_column(1, 1, 80)
+    ws_raw.set_column(2, 2, 12)
+    ws_raw.set_column(3, 3, 13)
+    # Hide delta columns to match legacy report layout
+    rise_blocks = [(spec_rise_start_col, len(specimen)), (furnace_rise_start_col, len(furnace))]
+    for first_col, count in rise_blocks:
+        if count:
+            ws_raw.set_column(first_col, first_col + count - 1, None, None, {"hidden": True})
+
+    ws_raw.freeze_panes(data_start_row, spec_abs_start_col)
+
+    ws_raw.write(0, 0, "Imported logger data (absolute and temperature rise)", title)
+    # Metadata block (rows 3-9)
     meta_rows = [
         ("Source file", source_filename),
         ("Name", parsed.metadata.get("Name", "")),
@@ -323,199 +525,129 @@ def build_report(parsed: ParsedLoggerFile, out_path: Path, source_filename: str)
         ("Specimen TCs", str(len(specimen))),
         ("Furnace TCs", str(len(furnace))),
     ]
-    start_meta = 3
-    for i, (k, v) in enumerate(meta_rows):
-        ws_raw.cell(start_meta + i, 1, k).font = Font(bold=True)
-        ws_raw.cell(start_meta + i, 2, v)
-    ws_raw.column_dimensions["A"].width = 18
-    ws_raw.column_dimensions["B"].width = 80
-
-    header_row_1 = 12  # group names
-    header_row_2 = 13  # column headers
-    data_start_row = 14
-
-    # Base columns
-    base_headers = ["Scan", "Date", "Time", "Elapsed (min)"]
-    for c, h in enumerate(base_headers, start=1):
-        ws_raw.cell(header_row_2, c, h)
-        ws_raw.cell(header_row_2, c).alignment = Alignment(horizontal="center", vertical="center")
-
-    # Specimen absolute
-    col = 5
-    spec_abs_start_col = col
-    for i, ch in enumerate(specimen, start=1):
-        ws_raw.cell(header_row_1, col, f"TC{i}")
-        ws_raw.cell(header_row_2, col, ch)
-        col += 1
-    spec_abs_end_col = col - 1
-
-    # Specimen rise
-    spec_rise_start_col = col
-    for i in range(1, len(specimen) + 1):
-        ws_raw.cell(header_row_1, col, f"TC{i} ΔT")
-        ws_raw.cell(header_row_2, col, f"ΔT{i}")
-        col += 1
-    spec_rise_end_col = col - 1
-
-    # Furnace absolute
-    furnace_abs_start_col = col
-    for i, ch in enumerate(furnace, start=1):
-        ws_raw.cell(header_row_1, col, f"Furnace TC{i}")
-        ws_raw.cell(header_row_2, col, ch)
-        col += 1
-    furnace_abs_end_col = col - 1
-
-    # Furnace rise
-    furnace_rise_start_col = col
-    for i in range(1, len(furnace) + 1):
-        ws_raw.cell(header_row_1, col, f"Furnace TC{i} ΔT")
-        ws_raw.cell(header_row_2, col, f"FΔT{i}")
-        col += 1
-    furnace_rise_end_col = col - 1
-
-    # Summary columns
-    summary_cols = [
-        "Mean face ΔT",
-        "Max face ΔT",
-        "Mean core ΔT",
-        "Furnace mean (abs)",
-        "Furnace mean ΔT",
-    ]
-    summary_start_col = col
-    for h in summary_cols:
-        ws_raw.cell(header_row_1, col, "Summary")
-        ws_raw.cell(header_row_2, col, h)
-        col += 1
-    summary_end_col = col - 1
-
-    # Style headers
-    _style_header(ws_raw, f"A{header_row_2}:{get_column_letter(summary_end_col)}{header_row_2}")
-    for c in range(1, summary_end_col + 1):
-        ws_raw.cell(header_row_1, c).alignment = Alignment(horizontal="center", vertical="center")
-    ws_raw.row_dimensions[header_row_1].height = 22
-    ws_raw.row_dimensions[header_row_2].height = 28
-    ws_raw.freeze_panes = ws_raw["E14"]
-
-    # Column widths
-    ws_raw.column_dimensions["C"].width = 12
-    ws_raw.column_dimensions["D"].width = 13
-    # Hide delta columns to match legacy report layout (keep formulas working)
-    for c in range(spec_rise_start_col, spec_rise_end_col + 1):
-        ws_raw.column_dimensions[get_column_letter(c)].hidden = True
-
-    for c in range(furnace_rise_start_col, furnace_rise_end_col + 1):
-        ws_raw.column_dimensions[get_column_letter(c)].hidden = True
-
-
-    # Fill data
-    for i, (scan, d, t, elapsed_min, values) in enumerate(parsed.rows):
-        r = data_start_row + i
-        ws_raw.cell(r, 1, scan)
-        ws_raw.cell(r, 2, d)
-        ws_raw.cell(r, 3, t)
-        ws_raw.cell(r, 4, float(elapsed_min))
-        ws_raw.cell(r, 2).number_format = "dd/mm/yyyy"
-        ws_raw.cell(r, 3).number_format = "hh:mm:ss"
-        ws_raw.cell(r, 4).number_format = "0"
-
-        # specimen absolute
-        for j, ch in enumerate(specimen):
-            v = values.get(ch)
-            ws_raw.cell(r, spec_abs_start_col + j, v)
-
-        # furnace absolute
-        for j, ch in enumerate(furnace):
-            v = values.get(ch)
-            ws_raw.cell(r, furnace_abs_start_col + j, v)
-
-    last_data_row = data_start_row + len(parsed.rows) - 1
-
-    # Formulas for rises and summaries
-    ambient_row = data_start_row  # first data row is ambient
-    for r in range(data_start_row, last_data_row + 1):
-        # specimen rises
-        for j in range(len(specimen)):
-            abs_col = spec_abs_start_col + j
-            rise_col = spec_rise_start_col + j
-            abs_addr = f"{get_column_letter(abs_col)}{r}"
-            amb_addr = f"{get_column_letter(abs_col)}{ambient_row}"
-            ws_raw.cell(r, rise_col).value = f"=IF({abs_addr}=\"\",\"\",{abs_addr}-{amb_addr})"
-            ws_raw.cell(r, rise_col).number_format = "0.0"
-
-        # furnace rises
-        for j in range(len(furnace)):
-            abs_col = furnace_abs_start_col + j
-            rise_col = furnace_rise_start_col + j
-            abs_addr = f"{get_column_letter(abs_col)}{r}"
-            amb_addr = f"{get_column_letter(abs_col)}{ambient_row}"
-            ws_raw.cell(r, rise_col).value = f"=IF({abs_addr}=\"\",\"\",{abs_addr}-{amb_addr})"
-            ws_raw.cell(r, rise_col).number_format = "0.0"
-
-        # mean/max/core using OFFSET over specimen rise columns
-        tc1_rise_addr = f"{get_column_letter(spec_rise_start_col)}{r}"
-        mean_face_col = summary_start_col
-        max_face_col = summary_start_col + 1
-        mean_core_col = summary_start_col + 2
-        furnace_mean_abs_col = summary_start_col + 3
-        furnace_mean_rise_col = summary_start_col + 4
-
-        ws_raw.cell(r, mean_face_col).value = (
-            f"=IF(Config!$B$4=0,\"\",AVERAGE(OFFSET({tc1_rise_addr},0,Config!$B$3-1,1,Config!$B$4)))"
-        )
-        ws_raw.cell(r, max_face_col).value = (
-            f"=IF(Config!$B$4=0,\"\",MAX(OFFSET({tc1_rise_addr},0,Config!$B$3-1,1,Config!$B$4)))"
-        )
-        ws_raw.cell(r, mean_core_col).value = (
-            f"=IF(Config!$B$7=0,\"\",AVERAGE(OFFSET({tc1_rise_addr},0,Config!$B$6-1,1,Config!$B$7)))"
-        )
-
-        # Furnace mean (abs) + rise
-        if len(furnace) > 0:
-            abs_start = f"{get_column_letter(furnace_abs_start_col)}{r}"
-            abs_end = f"{get_column_letter(furnace_abs_end_col)}{r}"
-            rise_start = f"{get_column_letter(furnace_rise_start_col)}{r}"
-            rise_end = f"{get_column_letter(furnace_rise_end_col)}{r}"
-            ws_raw.cell(r, furnace_mean_abs_col).value = f"=AVERAGE({abs_start}:{abs_end})"
-            ws_raw.cell(r, furnace_mean_rise_col).value = f"=AVERAGE({rise_start}:{rise_end})"
-        else:
-            ws_raw.cell(r, furnace_mean_abs_col).value = ""
-            ws_raw.cell(r, furnace_mean_rise_col).value = ""
-
-        for c in range(summary_start_col, summary_end_col + 1):
-            ws_raw.cell(r, c).number_format = "0.0"
+    for i, (k, v) in enumerate(meta_rows, start=2):
+        ws_raw.write(i, 0, k, bold)
+        ws_raw.write_string(i, 1, v)
+
+    # Header rows
+    group_names = (
+        [None] * 4
+        + [f"TC{i}" for i in range(1, len(specimen) + 1)]
+        + [f"TC{i} ΔT" for i in range(1, len(specimen) + 1)]
+        + [f"Furnace TC{i}" for i in range(1, len(furnace) + 1)]
+        + [f"Furnace TC{i} ΔT" for i in range(1, len(furnace) + 1)]
+        + ["Summary"] * 5
+    )
+    column_headers = (
+        ["Scan", "Date", "Time", "Elapsed (min)"]
+        + list(specimen)
+        + [f"ΔT{i}" for i in range(1, len(specimen) + 1)]
+        + list(furnace)
+        + [f"FΔT{i}" for i in range(1, len(furnace) + 1)]
+        + ["Mean face ΔT", "Max face ΔT", "Mean core ΔT", "Furnace mean (abs)", "Furnace mean ΔT"]
+    )
+    ws_raw.set_row(header_row_1, 22)
+    ws_raw.write_row(header_row_1, 0, group_names, center)
+    ws_raw.set_row(header_row_2, 28)
+    ws_raw.write_row(header_row_2, 0, column_headers, header)
+
+    # Rises and summaries are computed here and written as plain numbers, so Excel has
+    # nothing to recalculate on open. The first data row is ambient.
+    n_spec = len(specimen)
+    col_of = parsed.channel_to_col
+    absolute = parsed.values[:, [col_of[ch] for ch in specimen + furnace]]
+    rise = absolute - absolute[0]
+    # Face/core groups index specimen TCs only; a range running past the last one is cut short
+    # rather than spilling into the furnace columns.
+    spec_rise = rise[:, :n_spec]
+    face = spec_rise[:, face_start - 1 : face_start - 1 + face_count]
+    core = spec_rise[:, core_start - 1 : core_start - 1 + core_count]
+    n_rows = len(parsed.scans)
+    blank = np.full(n_rows, np.nan)
+    summary = np.column_stack([
+        _row_mean(face) if face_count else blank,
+        _row_max(face) if face_count else blank,
+        _row_mean(core) if core_count else blank,
+        _row_mean(absolute[:, n_spec:]),
+        _row_mean(rise[:, n_spec:]),
+    ])
+
+    # One float per cell, in sheet column order. Date and time cells hold Excel serial
+    # values (days since 1899-12-30, split into whole days and the fraction of a day).
+    ms = (parsed.timestamps - np.datetime64("1899-12-30", "ms")).astype(np.int64)
+    days, ms_of_day = np.divmod(ms, 86_400_000)
+    grid = np.column_stack([
+        parsed.scans,
+        days,
+        ms_of_day / 86_400_000,
+        parsed.elapsed_min,
+        absolute[:, :n_spec],
+        rise[:, :n_spec],
+        absolute[:, n_spec:],
+        rise[:, n_spec:],
+        summary,
+    ])
+    col_formats = (
+        [None, date_fmt, time_fmt, minutes_fmt]
+        + [None] * n_spec
+        + [one_dp] * n_spec
+        + [None] * len(furnace)
+        + [one_dp] * (len(furnace) + summary.shape[1])
+    )
+
+    # The ambient row goes through XlsxWriter, which also registers the cell formats in the
+    # workbook styles. The remaining rows are spliced into the sheet XML once the workbook is
+    # closed (see _append_sheet_rows): XlsxWriter's per-cell write path dominates the run time
+    # for long logs, while a row of XML is a single string join.
+    for c, (v, fmt) in enumerate(zip(grid[0].tolist(), col_formats)):
+        if v == v:
+            ws_raw.write_number(data_start_row, c, v, fmt)
+        elif fmt is not None:
+            # Blank ambient reading: a styled blank still registers the format for later rows.
+            ws_raw.write_blank(data_start_row, c, None, fmt)
+
+    last_data_row = data_start_row + n_rows - 1
 
     # ----------------
     # Summary sheet
     # ----------------
-    ws_summary["A1"] = "Test summary (auto-generated)"
-    ws_summary["A1"].font = Font(bold=True, size=16)
-    ws_summary["A3"] = "Source file"
-    ws_summary["B3"] = source_filename
-    ws_summary["A4"] = "Total specimen TCs"
-    ws_summary["B4"] = len(specimen)
-    ws_summary["A5"] = "Total furnace TCs"
-    ws_summary["B5"] = len(furnace)
-    ws_summary["A6"] = "Note"
-    ws_summary["B6"] = "Edit Config tab if face/core grouping differs (defaults: face 1-5, core 6-10)."
-    ws_summary.column_dimensions["A"].width = 22
-    ws_summary.column_dimensions["B"].width = 70
+    ws_summary.set_column(0, 0, 22)
+    ws_summary.set_column(1, 1, 70)
+    ws_summary.write(0, 0, "Test summary (auto-generated)", summary_title)
+    ws_summary.write_row(2, 0, ["Source file", source_filename])
+    ws_summary.write_row(3, 0, ["Total specimen TCs", len(specimen)])
+    ws_summary.write_row(4, 0, ["Total furnace TCs", len(furnace)])
+    ws_summary.write_row(5, 0, [
+        "Note",
+        "Face/core grouping is listed on the Config tab (defaults: face 1-5, core 6-10).",
+    ])
 
     # Create charts
+    # All three charts share the elapsed-minutes axis. Label roughly a dozen whole-minute
+    # categories rather than every point, which Excel would otherwise try to fit.
+    elapsed_ref = [ws_raw.name, data_start_row, 3, last_data_row, 3]
+    x_axis = {
+        "name": "Elapsed (min)",
+        "num_format": "0",
+        "num_format_linked": False,
+        "interval_unit": max(1, n_rows // 12),
+        "interval_tick": max(1, n_rows // 12),
+    }
+
     def add_line_chart(title: str, y_col: int, anchor: str) -> None:
-        chart = LineChart()
-        chart.title = title
-        chart.style = 2
-        chart.y_axis.title = "Temperature rise (°C)"
-        chart.x_axis.title = "Elapsed (min)"
-
-        xref = Reference(ws_raw, min_col=4, min_row=data_start_row, max_row=last_data_row)
-        yref = Reference(ws_raw, min_col=y_col, min_row=data_start_row, max_row=last_data_row)
-        chart.add_data(yref, titles_from_data=False)
-        chart.set_categories(xref)
-        chart.legend = None
-        chart.height = 8
-        chart.width = 18
-        ws_summary.add_chart(chart, anchor)
+        chart = wb.add_chart({"type": "line"})
+        chart.set_title({"name": title})
+        chart.set_style(2)
+        chart.set_y_axis({"name": "Temperature rise (°C)"})
+        chart.set_x_axis(x_axis)
+        chart.add_series({
+            "categories": elapsed_ref,
+            "values": [ws_raw.name, data_start_row, y_col, last_data_row, y_col],
+        })
+        chart.set_legend({"none": True})
+        # 18 cm x 8 cm at 96 dpi
+        chart.set_size({"width": 680, "height": 302})
+        ws_summary.insert_chart(anchor, chart)
 
     add_line_chart("Mean temperature rise (face)", summary_start_col, "A9")
     add_line_chart("Maximum temperature rise (face)", summary_start_col + 1, "A25")
@@ -524,17 +656,28 @@ def build_report(parsed: ParsedLoggerFile, out_path: Path, source_filename: str)
     # ----------------
     # Observations sheet
     # ----------------
-    ws_obs["A1"] = "Observations"
-    ws_obs["A1"].font = Font(bold=True, size=14)
-    ws_obs["A3"] = "(This tab is intentionally free-form. Paste or type your test-specific notes here.)"
-    ws_obs["A3"].alignment = Alignment(wrap_text=True)
-    ws_obs.column_dimensions["A"].width = 100
-
-    # Slightly nicer default view
-    for ws in [ws_summary, ws_obs, ws_raw, ws_cfg]:
-        ws.sheet_view.showGridLines = False
-
-    wb.save(out_path)
+    ws_obs.set_column(0, 0, 100)
+    ws_obs.write(0, 0, "Observations", title)
+    ws_obs.write(
+        2,
+        0,
+        "(This tab is intentionally free-form. Paste or type your test-specific notes here.)",
+        wb.add_format({"text_wrap": True}),
+    )
+
+    wb.close()
+
+    if n_rows > 1:
+        letters = _COL_LETTERS[: grid.shape[1]]
+        if any(fmt is not None and fmt.xf_index is None for fmt in col_formats):
+            raise RuntimeError("Raw Data cell format was not registered with the workbook.")
+        styles = [f' s="{fmt.xf_index}"' if fmt is not None else "" for fmt in col_formats]
+        _append_sheet_rows(
+            out_path,
+            f"xl/worksheets/sheet{ws_raw.index + 1}.xml",
+            _rows_xml(grid[1:], data_start_row + 2, letters, styles),
+            f"A1:{letters[-1]}{last_data_row + 1}",
+        )
 
 
 def main() -> None: